@@ -8,15 +8,83 @@
 """Parse DDL statements"""
 
 import re, textwrap, json
-from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from enum import IntEnum
+from functools import lru_cache
+from itertools import repeat
 
 from pyparsing import CaselessKeyword, Forward, Word, Regex, alphanums, \
-    delimitedList, Suppress, Optional, Group, OneOrMore
+    delimitedList, Suppress, Optional, Group, OneOrMore, ParserElement
+
+# BigQuery data type = ((bq data type, (data type, ...)), ...)
+# First match in order wins, compiled pattern is searched and str is compared exactly.
+_BQ_DATA_TYPE_DIC = (
+    ("STRING", (re.compile(r"(STRING|CHAR|TEXT|CLOB|JSON|UUID|ROWID|BFILE)"),)),
+    ("INTEGER", (re.compile(r"INT|SERIAL|YEAR"),)),
+    ("FLOAT", (re.compile(r"(FLOAT|DOUBLE)"), "REAL", "MONEY")),
+    ("DATETIME", ("DATE", "DATETIME", "TIMESTAMP", "TIMESTAMP WITHOUT TIME ZONE")),
+    ("TIMESTAMP", ("TIMESTAMPTZ", "TIMESTAMP WITH TIME ZONE", "TIMESTAMP WITH LOCAL TIME ZONE")),
+    # ("DATE", ("DATE",)),
+    ("TIME", ("TIME", "TIME WITHOUT TIME ZONE")),
+    ("BOOLEAN", (re.compile(r"BOOL"),)),
+    ("BYTES", ("BYTES", "BINARY", "VARBINARY", "BYTEA", "RAW", "LONG", "LONG RAW", "BLOB")),
+)
+
+# _BQ_DATA_TYPE_DIC fused into one pattern, group name is the BigQuery data type.
+# Each group is anchored at the start, so the alternation order keeps the table order.
+_BQ_COMBINED = re.compile("|".join(
+    "(?P<{}>{})".format(bq_type, "|".join(
+        "{}\\Z".format(re.escape(source_datatype)) if isinstance(source_datatype, str)
+        else ".*?(?:{})".format(source_datatype.pattern)
+        for source_datatype in source_datatypes))
+    for bq_type, source_datatypes in _BQ_DATA_TYPE_DIC), re.DOTALL)
+
+# Common data types, same result as the _BQ_DATA_TYPE_DIC scan for every source database
+_BQ_DIRECT = {
+    "CHAR": "STRING", "VARCHAR": "STRING", "CHARACTER VARYING": "STRING", "VARCHAR2": "STRING",
+    "NVARCHAR2": "STRING", "TEXT": "STRING", "STRING": "STRING", "CLOB": "STRING", "JSON": "STRING", "UUID": "STRING",
+    "INT": "INTEGER", "INTEGER": "INTEGER", "BIGINT": "INTEGER", "SMALLINT": "INTEGER", "TINYINT": "INTEGER",
+    "MEDIUMINT": "INTEGER", "SERIAL": "INTEGER", "BIGSERIAL": "INTEGER", "YEAR": "INTEGER",
+    "FLOAT": "FLOAT", "DOUBLE": "FLOAT", "DOUBLE PRECISION": "FLOAT", "REAL": "FLOAT", "MONEY": "FLOAT",
+    "DATE": "DATETIME", "DATETIME": "DATETIME", "TIMESTAMP": "DATETIME", "TIMESTAMP WITHOUT TIME ZONE": "DATETIME",
+    "TIMESTAMPTZ": "TIMESTAMP", "TIMESTAMP WITH TIME ZONE": "TIMESTAMP",
+    "TIME": "TIME", "TIME WITHOUT TIME ZONE": "TIME",
+    "BOOL": "BOOLEAN", "BOOLEAN": "BOOLEAN",
+    "BYTES": "BYTES", "BINARY": "BYTES", "VARBINARY": "BYTES", "BYTEA": "BYTES", "BLOB": "BYTES",
+}
+
+# Column constraint flags, bit = 1 << (group number - 1)
+_CONSTRAINT_RE = re.compile(r"(NOT NULL)|(PRIMARY KEY)|(UNIQUE)")
+_CONSTRAINT_NOT_NULL, _CONSTRAINT_PK, _CONSTRAINT_UNIQUE = 1, 2, 4
+
+# BigQuery JSON field encoder (same output as json.dumps(obj, ensure_ascii=False))
+_BQ_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# Column length = (precision or length, scale)
+_RE_LEN_SCALE = re.compile(r"([\d\*]+)\s*,*\s*(\d*)")
+
+# Column define patterns shared by the pyparsing grammar and _DdlFastParser
+_RE_COL_LENGTH = re.compile(r"[\d\*]+\s*,*\s*\d*")
+_RE_COL_NULL = re.compile(r"\b(?:NOT\s+)?NULL?\b", re.IGNORECASE)
+_RE_COL_AUTO_INCREMENT = re.compile(r"\bAUTO_INCREMENT\b", re.IGNORECASE)
+_RE_COL_KEY = re.compile(r"\b(UNIQUE|PRIMARY)(?:\s+KEY)?\b", re.IGNORECASE)
+_RE_COL_DEFAULT = re.compile(
+    r"\bDEFAULT\b\s+(?:((?:[A-Za-z0-9_\.\'\" -\{\}]|[^\x01-\x7E])*\:\:(?:character varying)?[A-Za-z0-9\[\]]+)|(?:\')((?:\\\'|[^\']|,)+)(?:\')|(?:\")((?:\\\"|[^\"]|,)+)(?:\")|([^,\s]+))",
+    re.IGNORECASE)
+
+# Column constraint values
+_RE_CONSTRAINT_PRIMARY = re.compile(r"PRIMARY", re.IGNORECASE)
+_RE_CONSTRAINT_UNIQUE = re.compile(r"UNIQUE", re.IGNORECASE)
+_RE_CONSTRAINT_NOT_NULL = re.compile(r"(NOT\s+NULL)", re.IGNORECASE)
+_RE_CONSTRAINT_ENCODE = re.compile(r"\bENCODE\s+([A-Za-z0-9]+)\b", re.IGNORECASE)
+_RE_CONSTRAINT_COMMENT = re.compile(r"\bCOMMENT\b\s+(?:(?:\')((?:\\\'|[^\']|,)+)(?:\')|(?:\")((?:\\\"|[^\"]|,)+)(?:\")|([^,\s]+))", re.IGNORECASE)
+_RE_CONSTRAINT_LEGACY_COMMENT = re.compile(r"(?:\bCOMMENT\b\s+)(['\"])(.+)\1", re.IGNORECASE)
 
 
 class DdlParseBase():
 
+    __slots__ = ()
+
     NAME_CASE = IntEnum("NAME_CASE", "original lower upper")
     DATABASE = IntEnum("DATABASE", "mysql, postgresql, oracle, redshift")
 
@@ -37,8 +105,15 @@ class DdlParseBase():
         self._source_database = source_database
 
 
+# DdlParseBase.NAME_CASE values as plain int, compared without enum attribute lookups
+_NC_LOWER = DdlParseBase.NAME_CASE.lower.value
+_NC_UPPER = DdlParseBase.NAME_CASE.upper.value
+
+
 class DdlParseTableColumnBase(DdlParseBase):
 
+    __slots__ = ("_source_database", "_name")
+
     def __init__(self, source_database=None):
         super().__init__(source_database)
         self._name = ""
@@ -63,9 +138,9 @@ class DdlParseTableColumnBase(DdlParseBase):
 
         :return: name
         """
-        if name_case == self.NAME_CASE.lower:
+        if name_case == _NC_LOWER:
             return self._name.lower()
-        elif name_case == self.NAME_CASE.upper:
+        elif name_case == _NC_UPPER:
             return self._name.upper()
         else:
             return self._name
@@ -74,6 +149,12 @@ class DdlParseTableColumnBase(DdlParseBase):
 class DdlParseColumn(DdlParseTableColumnBase):
     """Column define info"""
 
+    __slots__ = (
+        "_data_type", "_numeric_is_unsigned", "_numeric_is_zerofill", "_length", "_scale", "_array_dimensional",
+        "_constraint", "_not_null", "_pk", "_unique", "_auto_increment", "_distkey", "_sortkey", "_character_set",
+        "_encode", "_default", "_comment", "_constraint_str", "_bq_type_cache", "_bq_mode_cache",
+    )
+
     def __init__(self, name, data_type_array, array_brackets=None, constraint=None, source_database=None):
         """
         :param data_type_array[]: Column data type ['data type name'] or ['data type name', '(length)'] or ['data type name', '(precision, scale)']
@@ -88,6 +169,20 @@ class DdlParseColumn(DdlParseTableColumnBase):
         self.constraint = constraint
         self._array_dimensional = 0 if array_brackets is None else array_brackets.count('[]')
 
+    @property
+    def source_database(self):
+        """
+        Source database option
+
+        :param source_database: enum DdlParse.DATABASE
+        """
+        return super().source_database
+
+    @source_database.setter
+    def source_database(self, source_database):
+        super(DdlParseColumn, DdlParseColumn).source_database.__set__(self, source_database)
+        self._bq_type_cache = None
+
     @property
     def data_type(self):
         return self._data_type
@@ -118,39 +213,61 @@ class DdlParseColumn(DdlParseTableColumnBase):
         self._numeric_is_zerofill = True if "zerofill" in data_type_array else False
         self._length = None
         self._scale = None
+        self._bq_type_cache = None
 
         if "length" in data_type_array:
-            matches = re.findall(r"([\d\*]+)\s*,*\s*(\d*)", data_type_array["length"])
-            if len(matches) > 0:
-                self._length = matches[0][0] if matches[0][0] == "*" else int(matches[0][0])
-                self._scale = None if len(matches[0]) < 2 or matches[0][1] == "" or int(matches[0][1]) == 0 else int(matches[0][1])
+            length, _, scale = data_type_array["length"].partition(",")
+            length = length.strip()
+            scale = scale.strip()
+
+            if (length == "*" or length.isdecimal()) and (scale == "" or scale.isdecimal()):
+                # "length" or "precision, scale"
+                self._length = length if length == "*" else int(length)
+                self._scale = None if scale == "" or int(scale) == 0 else int(scale)
+
+            else:
+                match = _RE_LEN_SCALE.search(data_type_array["length"])
+                if match is not None:
+                    length, scale = match.groups()
+                    self._length = length if length == "*" else int(length)
+                    self._scale = None if scale == "" or int(scale) == 0 else int(scale)
 
 
     @property
     def constraint(self):
         """Constraint string"""
-        constraint_arr = []
-        if self._not_null:
-            constraint_arr.append("PRIMARY KEY" if self._pk else "NOT NULL")
-        if self._unique:
-            constraint_arr.append("UNIQUE")
 
-        return " ".join(constraint_arr)
+        if self._constraint_str is None:
+            constraint_arr = []
+            if self._not_null:
+                constraint_arr.append("PRIMARY KEY" if self._pk else "NOT NULL")
+            if self._unique:
+                constraint_arr.append("UNIQUE")
+
+            self._constraint_str = " ".join(constraint_arr)
+
+        return self._constraint_str
 
     @constraint.setter
     def constraint(self, constraint):
+        self._constraint_str = None
+        self._bq_mode_cache = None
 
         # Compatibility v1.6.1 and earlier
         if type(constraint) is str:
             self._constraint = None if constraint is None else constraint.upper()
 
-            self._not_null = False if self._constraint is None or not re.search(r"(NOT NULL|PRIMARY KEY)", self._constraint) else True
-            self._pk = False if self._constraint is None or not re.search("PRIMARY KEY", self._constraint) else True
-            self._unique = False if self._constraint is None or not re.search("UNIQUE", self._constraint) else True
+            flags = 0
+            for m in _CONSTRAINT_RE.finditer(self._constraint):
+                flags |= 1 << (m.lastindex - 1)
+
+            self._pk = bool(flags & _CONSTRAINT_PK)
+            self._not_null = bool(flags & (_CONSTRAINT_NOT_NULL | _CONSTRAINT_PK))
+            self._unique = bool(flags & _CONSTRAINT_UNIQUE)
 
             self._comment = None
             if constraint is not None:
-                matches = re.findall(r"(?:\bCOMMENT\b\s+)(['\"])(.+)\1", constraint, re.IGNORECASE)
+                matches = _RE_CONSTRAINT_LEGACY_COMMENT.findall(constraint)
                 if len(matches) > 0:
                     self._comment = matches[0][1]
 
@@ -159,7 +276,10 @@ class DdlParseColumn(DdlParseTableColumnBase):
 
         # v1.7.0 or later
 
-        self._constraint = None if constraint is None else ' '.join(constraint).upper()
+        if isinstance(constraint, dict):
+            self._constraint = ' '.join(constraint.values()).upper()
+        else:
+            self._constraint = None if constraint is None else ' '.join(constraint).upper()
 
         constraints = {}
         constraints['null'] = ''
@@ -177,13 +297,13 @@ class DdlParseColumn(DdlParseTableColumnBase):
                 constraints[constraint_name] = val
 
 
-        self._pk = True if re.search("PRIMARY", constraints['key'], re.IGNORECASE) else False
+        self._pk = True if _RE_CONSTRAINT_PRIMARY.search(constraints['key']) else False
 
         self._not_null = False
-        if self._pk or re.search(r"(NOT\s+NULL)", constraints['null'], re.IGNORECASE):
+        if self._pk or _RE_CONSTRAINT_NOT_NULL.search(constraints['null']):
             self._not_null = True
 
-        self._unique = True if re.search("UNIQUE", constraints['key'], re.IGNORECASE) else False
+        self._unique = True if _RE_CONSTRAINT_UNIQUE.search(constraints['key']) else False
 
         self._auto_increment = True if len(constraints['auto_increment']) > 0 else False
         self._distkey        = True if len(constraints['distkey']) > 0 else False
@@ -192,22 +312,19 @@ class DdlParseColumn(DdlParseTableColumnBase):
 
         self._encode = None
         if constraint is not None:
-            matches = re.findall(r"\bENCODE\s+([A-Za-z0-9]+)\b", constraints['encode'], re.IGNORECASE)
+            matches = _RE_CONSTRAINT_ENCODE.findall(constraints['encode'])
             if len(matches) > 0:
                 self._encode = matches[0]
 
         self._default = None
         if constraint is not None:
-            matches = re.findall(
-                r"\bDEFAULT\b\s+(?:((?:[A-Za-z0-9_\.\'\" -\{\}]|[^\x01-\x7E])*\:\:(?:character varying)?[A-Za-z0-9\[\]]+)|(?:\')((?:\\\'|[^\']|,)+)(?:\')|(?:\")((?:\\\"|[^\"]|,)+)(?:\")|([^,\s]+))",
-                constraints['default'],
-                re.IGNORECASE)
+            matches = _RE_COL_DEFAULT.findall(constraints['default'])
             if len(matches) > 0:
                 self._default = ''.join(matches[0])
 
         self._comment = None
         if constraint is not None:
-            matches = re.findall(r"\bCOMMENT\b\s+(?:(?:\')((?:\\\'|[^\']|,)+)(?:\')|(?:\")((?:\\\"|[^\"]|,)+)(?:\")|([^,\s]+))", constraints['comment'], re.IGNORECASE)
+            matches = _RE_CONSTRAINT_COMMENT.findall(constraints['comment'])
             if len(matches) > 0:
                 self._comment = ''.join(matches[0])
 
@@ -240,6 +357,8 @@ class DdlParseColumn(DdlParseTableColumnBase):
     @not_null.setter
     def not_null(self, flag):
         self._not_null = flag
+        self._constraint_str = None
+        self._bq_mode_cache = None
 
     @property
     def primary_key(self):
@@ -248,6 +367,7 @@ class DdlParseColumn(DdlParseTableColumnBase):
     @primary_key.setter
     def primary_key(self, flag):
         self._pk = flag
+        self._constraint_str = None
 
     @property
     def unique(self):
@@ -256,6 +376,7 @@ class DdlParseColumn(DdlParseTableColumnBase):
     @unique.setter
     def unique(self, flag):
         self._unique = flag
+        self._constraint_str = None
 
     @property
     def auto_increment(self):
@@ -285,34 +406,19 @@ class DdlParseColumn(DdlParseTableColumnBase):
     def bigquery_data_type(self):
         """Get BigQuery Legacy SQL data type"""
 
-        # BigQuery data type = {source_database: [data type, ...], ...}
-        BQ_DATA_TYPE_DIC = OrderedDict()
-        BQ_DATA_TYPE_DIC["STRING"] = {None: [re.compile(r"(STRING|CHAR|TEXT|CLOB|JSON|UUID|ROWID|BFILE)")]}
-        BQ_DATA_TYPE_DIC["INTEGER"] = {None: [re.compile(r"INT|SERIAL|YEAR")]}
-        BQ_DATA_TYPE_DIC["FLOAT"] = {None: [re.compile(r"(FLOAT|DOUBLE)"), "REAL", "MONEY"]}
-        BQ_DATA_TYPE_DIC["DATETIME"] = {
-            None: ["DATE", "DATETIME", "TIMESTAMP", "TIMESTAMP WITHOUT TIME ZONE"]
-        }
-        BQ_DATA_TYPE_DIC["TIMESTAMP"] = {None: ["TIMESTAMPTZ", "TIMESTAMP WITH TIME ZONE", "TIMESTAMP WITH LOCAL TIME ZONE"]}
-        #BQ_DATA_TYPE_DIC["DATE"] = {None: ["DATE"]}
-        BQ_DATA_TYPE_DIC["TIME"] = {None: ["TIME", "TIME WITHOUT TIME ZONE"]}
-        BQ_DATA_TYPE_DIC["BOOLEAN"] = {None: [re.compile(r"BOOL")]}
-        BQ_DATA_TYPE_DIC["BYTES"] = {None: ["BYTES", "BINARY", "VARBINARY", "BYTEA", "RAW", "LONG", "LONG RAW", "BLOB"]}
-
-        for bq_type, conditions in BQ_DATA_TYPE_DIC.items():
-            for source_db, source_datatypes in conditions.items():
-                for source_datatype in source_datatypes:
-
-                    if isinstance(source_datatype, str):
-                        if self._data_type == source_datatype \
-                            and (  self._source_database == source_db
-                                or (self._source_database is not None and source_db is None)):
-                            return bq_type
-
-                    elif re.search(source_datatype, self._data_type) \
-                        and (  self._source_database == source_db
-                            or (self._source_database is not None and source_db is None)):
-                        return bq_type
+        if self._bq_type_cache is None:
+            self._bq_type_cache = self._get_bigquery_data_type()
+
+        return self._bq_type_cache
+
+    def _get_bigquery_data_type(self):
+        bq_type = _BQ_DIRECT.get(self._data_type)
+        if bq_type is not None:
+            return bq_type
+
+        m = _BQ_COMBINED.match(self._data_type)
+        if m is not None:
+            return m.lastgroup
 
         if self._data_type in ["NUMERIC", "NUMBER", "DECIMAL", "DEC", "FIXED"]:
             if self._length is None:
@@ -362,63 +468,62 @@ class DdlParseColumn(DdlParseTableColumnBase):
     def bigquery_mode(self):
         """Get BigQuery constraint"""
 
-        if self.array_dimensional > 0:
-            return "REPEATED"
-        elif self.not_null:
-            return "REQUIRED"
-        else:
-            return "NULLABLE"
+        if self._bq_mode_cache is None:
+            if self.array_dimensional > 0:
+                self._bq_mode_cache = "REPEATED"
+            elif self.not_null:
+                self._bq_mode_cache = "REQUIRED"
+            else:
+                self._bq_mode_cache = "NULLABLE"
+
+        return self._bq_mode_cache
 
     def to_bigquery_field(self, name_case=DdlParseBase.NAME_CASE.original, use_length=False, use_default=False):
         """Generate BigQuery JSON field define"""
-        max_length = None
-        default_value = None
-        col_name = self.get_name(name_case)
-        mode = self.bigquery_mode
 
-        if use_default:
-            default_value = {self.default} if self.default is not None else None
-        if use_length:
-            max_length = {self.precision} if self.precision is not None else None
+        return _BQ_JSON_ENCODER.encode(self._to_bigquery_dict(name_case, use_length, use_default))
+
+    def _to_bigquery_dict(self, name_case, use_length, use_default):
+        """Generate BigQuery field define dict"""
 
-        if self.array_dimensional <= 1:
+        col = {"name": self.get_name(name_case)}
+
+        if self._array_dimensional <= 1:
             # no or one dimensional array data type
-            type = self.bigquery_legacy_data_type
+            col['type'] = self.bigquery_data_type
+            col['mode'] = self.bigquery_mode
 
         else:
             # multiple dimensional array data type
-            type = "RECORD"
+            col['type'] = "RECORD"
+            col['mode'] = self.bigquery_mode
 
-            fields = OrderedDict()
+            fields = {}
             fields_cur = fields
 
-            for i in range(1, self.array_dimensional):
-                is_last = True if i == self.array_dimensional - 1 else False
+            for i in range(1, self._array_dimensional):
+                is_last = True if i == self._array_dimensional - 1 else False
 
-                fields_cur['fields'] = [OrderedDict()]
+                fields_cur['fields'] = [{}]
                 fields_cur = fields_cur['fields'][0]
 
                 fields_cur['name'] = "dimension_{}".format(i)
-                fields_cur['type'] = self.bigquery_legacy_data_type if is_last else "RECORD"
+                fields_cur['type'] = self.bigquery_data_type if is_last else "RECORD"
                 fields_cur['mode'] = self.bigquery_mode if is_last else "REPEATED"
 
-        col = OrderedDict()
-        col['name'] = col_name
-        col['type'] = type
-        col['mode'] = mode
-        if default_value is not None and list(default_value)[0] is not None:
-            col['defaultValueExpression'] = '{}'.format(list(default_value)[0])
-        if max_length is not None and list(max_length)[0] is not None:
-            col['maxLength'] = '{}'.format(list(max_length)[0])
-        if self.description is not None:
-            col['description'] = self.description
-        if self.array_dimensional > 1:
+        if use_default and self._default is not None:
+            col['defaultValueExpression'] = str(self._default)
+        if use_length and self._length is not None:
+            col['maxLength'] = str(self._length)
+        if self._comment is not None:
+            col['description'] = self._comment
+        if self._array_dimensional > 1:
             col['fields'] = fields['fields']
 
-        return json.dumps(col, ensure_ascii=False)
+        return col
 
 
-class DdlParseColumnDict(OrderedDict, DdlParseBase):
+class DdlParseColumnDict(dict, DdlParseBase):
     """
     Columns dictionary collection
 
@@ -432,17 +537,20 @@ class DdlParseColumnDict(OrderedDict, DdlParseBase):
         self.source_database = source_database
 
     def __getitem__(self, key):
-        return super().__getitem__(key.lower())
+        return dict.__getitem__(self, key.lower())
 
     def __setitem__(self, key, value):
-        super().__setitem__(key.lower(), value)
+        dict.__setitem__(self, key.lower(), value)
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key.lower())
 
     def append(self, column_name, data_type_array=None, array_brackets=None, constraint=None, source_database=None):
         if source_database is None:
             source_database = self.source_database
 
         column = DdlParseColumn(column_name, data_type_array, array_brackets, constraint, source_database)
-        self.__setitem__(column_name, column)
+        dict.__setitem__(self, column_name.lower(), column)
         return column
 
     def to_bigquery_fields(self, name_case=DdlParseBase.NAME_CASE.original, use_length=False, use_default=False):
@@ -459,21 +567,21 @@ class DdlParseColumnDict(OrderedDict, DdlParseBase):
         :return: BigQuery JSON fields define
         """
 
-        bq_fields = []
+        encode = _BQ_JSON_ENCODER.encode
 
-        for col in self.values():
-            bq_fields.append(col.to_bigquery_field(name_case, use_length, use_default))
-
-        return "[{}]".format(",".join(bq_fields))
+        return "[" + ",".join([encode(col._to_bigquery_dict(name_case, use_length, use_default)) for col in self.values()]) + "]"
 
 
 class DdlParseTable(DdlParseTableColumnBase):
     """Table define info"""
 
+    __slots__ = ("_schema", "_columns", "_is_temp")
+
     def __init__(self, source_database=None):
         super().__init__(source_database)
         self._schema = None
         self._columns = DdlParseColumnDict(source_database)
+        self._is_temp = False
 
     @property
     def source_database(self):
@@ -553,14 +661,14 @@ class DdlParseTable(DdlParseTableColumnBase):
             dataset = "dataset"
         else:
             if schema_name is not None:
-                if name_case == self.NAME_CASE.lower:
+                if name_case == _NC_LOWER:
                     dataset = schema_name.lower()
-                elif name_case == self.NAME_CASE.upper:
+                elif name_case == _NC_UPPER:
                     dataset = schema_name.upper()
             else:
-                if name_case == self.NAME_CASE.lower:
+                if name_case == _NC_LOWER:
                     dataset = self.schema.lower()
-                elif name_case == self.NAME_CASE.upper:
+                elif name_case == _NC_UPPER:
                     dataset = self.schema.upper()
 
         cols_defs = []
@@ -615,8 +723,275 @@ class DdlParseTable(DdlParseTableColumnBase):
         )
 
 
-class DdlParse(DdlParseBase):
-    """DDL parser"""
+class _DdlFastParserUnsupported(Exception):
+    """DDL is out of the _DdlFastParser scope"""
+
+
+class _DdlFastParser():
+    """
+    Hand-written CREATE TABLE parser
+
+    Supports the common subset of the _build_grammar() grammar
+    and returns the _parse_cached result.
+    Raise _DdlFastParserUnsupported for anything else,
+    then the caller falls back to the pyparsing grammar.
+    """
+
+    _TOKEN_RE = re.compile(r"""
+        [ \t\r\n]*
+        (?:
+            (?P<COMMENT>--[^\n]*)
+            | (?P<QUOTED>`[^`]*`|"[^"]*")
+            | (?P<IDENT>[A-Za-z0-9_]+)
+            | (?P<PUNCT>[(),;.])
+            | (?P<OTHER>.)
+        )""", re.VERBOSE | re.DOTALL)
+    _WS_RE = re.compile(r"[ \t\r\n]*")
+    _ARRAY_BRACKETS_RE = re.compile(r"[\\\[\]]+")
+    _NAME_RE = re.compile(r"[A-Za-z0-9_]+")
+    _QUOTED_COLUMN_NAME_RE = re.compile(r"[A-Za-z0-9_][A-Za-z0-9_ ]*")
+    _TABLE_NAME_RE = re.compile(r"[A-Za-z0-9_<>]+")
+    _IDENT_CHARS = alphanums + "_$"
+
+    def __init__(self, ddl):
+        # pyparsing expands tabs before parsing
+        self._ddl = ddl.expandtabs()
+        self._pos = 0
+
+    def _peek(self):
+        """Return (kind, text) of the next token, (None, None) at the end"""
+        m = self._TOKEN_RE.match(self._ddl, self._pos)
+        if m is None:
+            return None, None
+        return m.lastgroup, m.group(m.lastgroup)
+
+    def _next(self):
+        m = self._TOKEN_RE.match(self._ddl, self._pos)
+        if m is None:
+            raise _DdlFastParserUnsupported()
+        self._pos = m.end()
+        return m.lastgroup, m.group(m.lastgroup)
+
+    def _skip_ws(self):
+        self._pos = self._WS_RE.match(self._ddl, self._pos).end()
+        return self._pos
+
+    def _keyword(self, keyword):
+        """Consume caseless keyword, same boundary rule as pyparsing CaselessKeyword"""
+        pos = self._skip_ws()
+        end = pos + len(keyword)
+        if self._ddl[pos:end].upper() != keyword \
+            or (end < len(self._ddl) and self._ddl[end].upper() in self._IDENT_CHARS) \
+            or (pos > 0 and self._ddl[pos - 1].upper() in self._IDENT_CHARS):
+            return False
+        self._pos = end
+        return True
+
+    def _regex(self, pattern):
+        """Consume pattern match, same as pyparsing Regex"""
+        m = pattern.match(self._ddl, self._skip_ws())
+        if m is None:
+            return None
+        self._pos = m.end()
+        return m.group(0)
+
+    def _punct(self, punct):
+        kind, text = self._peek()
+        if kind != "PUNCT" or text != punct:
+            return False
+        self._next()
+        return True
+
+    def _name(self, name_re):
+        """Consume identifier with optional quotes"""
+        kind, text = self._next()
+        if kind == "QUOTED":
+            text = text[1:-1]
+        elif kind != "IDENT":
+            raise _DdlFastParserUnsupported()
+        if not name_re.fullmatch(text):
+            raise _DdlFastParserUnsupported()
+        return text
+
+    def _comments(self):
+        """Consume comments, return comment count"""
+        count = 0
+        while self._peek()[0] == "COMMENT":
+            kind, text = self._next()
+            # pyparsing "--" + Regex(".+") would continue to the next line
+            if not text[2:].strip(" \r"):
+                raise _DdlFastParserUnsupported()
+            count += 1
+        return count
+
+    def parse(self):
+        """
+        Parse DDL script.
+
+        :return: (schema, table name, temp flag, ((kind, fields), ...)),
+            None when the DDL is out of scope.
+        """
+        try:
+            return self._parse_create_table()
+        except _DdlFastParserUnsupported:
+            return None
+
+    def _parse_create_table(self):
+        self._comments()
+        if not self._keyword("CREATE"):
+            raise _DdlFastParserUnsupported()
+        is_temp = self._keyword("TEMP")
+        if not self._keyword("TABLE"):
+            raise _DdlFastParserUnsupported()
+        self._keyword("IF NOT EXISTS")
+
+        schema = None
+        name = self._name(self._TABLE_NAME_RE)
+        if self._punct("."):
+            if not self._NAME_RE.fullmatch(name):
+                raise _DdlFastParserUnsupported()
+            schema = name
+            name = self._name(self._TABLE_NAME_RE)
+
+        if not self._punct("("):
+            raise _DdlFastParserUnsupported()
+
+        columns = []
+        while True:
+            self._parse_item(columns)
+
+            if not self._punct(","):
+                break
+            if self._peek() == ("PUNCT", ")"):
+                # Trailing comma ends the column list
+                break
+
+        return schema, name, is_temp, tuple(columns)
+
+    def _parse_item(self, columns):
+        count = self._comments()
+
+        if self._peek()[1] not in (",", ")"):
+            kind, text = self._peek()
+            if kind == "IDENT" and text.upper() in ("KEY", "FOREIGN"):
+                # Index or foreign key
+                raise _DdlFastParserUnsupported()
+
+            pos = self._pos
+            if self._keyword("CONSTRAINT") or self._keyword("PRIMARY KEY") or self._keyword("UNIQUE") \
+                    or self._keyword("NOT NULL"):
+                self._pos = pos
+                columns.append(("constraint", self._parse_constraint()))
+            else:
+                columns.append(("column", self._parse_column()))
+
+            count += 1 + self._comments()
+
+            if self._peek()[1] not in (",", ")"):
+                raise _DdlFastParserUnsupported()
+
+        if count == 0:
+            raise _DdlFastParserUnsupported()
+
+    def _parse_constraint(self):
+        constraint = {}
+
+        if self._keyword("CONSTRAINT"):
+            self._name(self._NAME_RE)
+
+        for constraint_type in ("PRIMARY KEY", "UNIQUE KEY", "UNIQUE", "NOT NULL"):
+            if self._keyword(constraint_type):
+                constraint["type"] = constraint_type
+                break
+        else:
+            raise _DdlFastParserUnsupported()
+
+        if self._peek()[0] in ("IDENT", "QUOTED"):
+            self._name(self._NAME_RE)
+
+        if not self._punct("("):
+            raise _DdlFastParserUnsupported()
+        constraint_columns = [self._name(self._NAME_RE)]
+        while self._punct(","):
+            constraint_columns.append(self._name(self._NAME_RE))
+        if not self._punct(")"):
+            raise _DdlFastParserUnsupported()
+
+        constraint["constraint_columns"] = tuple(constraint_columns)
+        return constraint
+
+    def _parse_column(self):
+        column = {}
+
+        kind, text = self._next()
+        if kind == "QUOTED":
+            text = text[1:-1]
+            if not self._QUOTED_COLUMN_NAME_RE.fullmatch(text):
+                raise _DdlFastParserUnsupported()
+        elif kind != "IDENT":
+            raise _DdlFastParserUnsupported()
+        column["name"] = text
+
+        # Data type
+        kind, text = self._next()
+        if kind != "IDENT":
+            raise _DdlFastParserUnsupported()
+        type_name = [text]
+        for suffix in ("WITHOUT TIME ZONE", "WITH TIME ZONE", "PRECISION", "VARYING"):
+            if self._keyword(suffix):
+                type_name.append(suffix)
+                break
+        data_type = {"type_name": type_name}
+
+        if self._punct("("):
+            length = self._regex(_RE_COL_LENGTH)
+            if length is None:
+                raise _DdlFastParserUnsupported()
+            data_type["length"] = length
+            if not self._keyword("CHAR"):
+                self._keyword("BYTE")
+            if not self._punct(")"):
+                raise _DdlFastParserUnsupported()
+
+        if self._keyword("UNSIGNED"):
+            data_type["unsigned"] = "UNSIGNED"
+        if self._keyword("ZEROFILL"):
+            data_type["zerofill"] = "ZEROFILL"
+        column["type"] = data_type
+
+        column["array_brackets"] = self._regex(self._ARRAY_BRACKETS_RE)
+
+        # Column constraint, in any order
+        column["constraint"] = None
+        if not self._ddl.startswith("--", self._skip_ws()):
+            constraint = {}
+            remaining = [
+                ("null", _RE_COL_NULL),
+                ("auto_increment", _RE_COL_AUTO_INCREMENT),
+                ("key", _RE_COL_KEY),
+                ("distkey", "DISTKEY"),
+                ("sortkey", "SORTKEY"),
+            ]
+            while remaining:
+                for i, (constraint_name, expr) in enumerate(remaining):
+                    if isinstance(expr, str):
+                        val = expr if self._keyword(expr) else None
+                    else:
+                        val = self._regex(expr)
+                    if val is not None:
+                        constraint[constraint_name] = val
+                        del remaining[i]
+                        break
+                else:
+                    break
+            column["constraint"] = constraint
+
+        return column
+
+
+@lru_cache(maxsize=None)
+def _build_grammar():
+    """Build the pyparsing grammar on first use"""
 
     _LPAR, _RPAR, _COMMA, _SEMICOLON, _DOT, _DOUBLEQUOTE, _BACKQUOTE, _SPACE = map(Suppress, "(),;.\"` ")
     _CREATE, _TABLE, _TEMP, _CONSTRAINT, _NOT_NULL, _PRIMARY_KEY, _UNIQUE, _UNIQUE_KEY, _FOREIGN_KEY, _REFERENCES, _KEY, _CHAR_SEMANTICS, _BYTE_SEMANTICS = \
@@ -635,11 +1010,19 @@ class DdlParse(DdlParseBase):
         _FK_ON + CaselessKeyword("UPDATE") + (_FK_ON_OPT_RESTRICT | _FK_ON_OPT_CASCADE | _FK_ON_OPT_SET_NULL | _FK_ON_OPT_NO_ACTION)
     _SUPPRESS_QUOTE = _BACKQUOTE | _DOUBLEQUOTE
 
+    def _quoted_word(word_chars):
+        """
+        Same as Optional(_SUPPRESS_QUOTE) + Word(alphanums + word_chars) + Optional(_SUPPRESS_QUOTE),
+        matched by one Regex instead of probing for quotes.
+        """
+        pattern = re.compile(r"[`\"]?[ \t\r\n]*([A-Za-z0-9{}]+)(?:[ \t\r\n]*[`\"])?".format(re.escape(word_chars)))
+        return Regex(pattern).setParseAction(lambda tokens: pattern.match(tokens[0]).group(1))
+
     _COMMENT = Suppress("--" + Regex(r".+"))
 
 
     _CREATE_TABLE_STATEMENT = Suppress(_CREATE) + Optional(_TEMP)("temp") + Suppress(_TABLE) + Optional(Suppress(CaselessKeyword("IF NOT EXISTS"))) \
-        + Optional(_SUPPRESS_QUOTE) + Optional(Word(alphanums + "_")("schema") + Optional(_SUPPRESS_QUOTE) + _DOT + Optional(_SUPPRESS_QUOTE)) + Word(alphanums + "_<>")("table") + Optional(_SUPPRESS_QUOTE) \
+        + Optional(_quoted_word("_")("schema") + _DOT) + _quoted_word("_<>")("table") \
         + _LPAR \
         + delimitedList(
             OneOrMore(
@@ -649,20 +1032,20 @@ class DdlParse(DdlParseBase):
                 Suppress(_KEY + Word(alphanums + "_'`() "))
                 |
                 Group(
-                    Optional(Suppress(_CONSTRAINT) + Optional(_SUPPRESS_QUOTE) + Word(alphanums + "_")("name") + Optional(_SUPPRESS_QUOTE))
+                    Optional(Suppress(_CONSTRAINT) + _quoted_word("_")("name"))
                     + (
                         (
                             (_PRIMARY_KEY ^ _UNIQUE ^ _UNIQUE_KEY ^ _NOT_NULL)("type")
                             + Optional(_SUPPRESS_QUOTE) + Optional(Word(alphanums + "_"))("name") + Optional(_SUPPRESS_QUOTE)
-                            + _LPAR + Group(delimitedList(Optional(_SUPPRESS_QUOTE) + Word(alphanums + "_") + Optional(_SUPPRESS_QUOTE)))("constraint_columns") + _RPAR
+                            + _LPAR + Group(delimitedList(_quoted_word("_")))("constraint_columns") + _RPAR
                         )
                         |
                         (
                             (_FOREIGN_KEY)("type")
-                            + _LPAR + Group(delimitedList(Optional(_SUPPRESS_QUOTE) + Word(alphanums + "_") + Optional(_SUPPRESS_QUOTE)))("constraint_columns") + _RPAR
+                            + _LPAR + Group(delimitedList(_quoted_word("_")))("constraint_columns") + _RPAR
                             + Optional(Suppress(_REFERENCES)
-                                + Optional(_SUPPRESS_QUOTE) + Word(alphanums + "_")("references_table") + Optional(_SUPPRESS_QUOTE)
-                                + _LPAR + Group(delimitedList(Optional(_SUPPRESS_QUOTE) + Word(alphanums + "_") + Optional(_SUPPRESS_QUOTE)))("references_columns") + _RPAR
+                                + _quoted_word("_")("references_table")
+                                + _LPAR + Group(delimitedList(_quoted_word("_")))("references_columns") + _RPAR
                                 + Optional(_FK_MATCH)("references_fk_match")  # MySQL
                                 + Optional(_FK_ON_DELETE)("references_fk_on_delete")  # MySQL
                                 + Optional(_FK_ON_UPDATE)("references_fk_on_update")  # MySQL
@@ -672,13 +1055,14 @@ class DdlParse(DdlParseBase):
                 )("constraint")
                 |
                 Group(
-                    ((_SUPPRESS_QUOTE + Word(alphanums + " _")("name") + _SUPPRESS_QUOTE) ^ (Optional(_SUPPRESS_QUOTE) + Word(alphanums + "_")("name") + Optional(_SUPPRESS_QUOTE)))
+                    # Quoted name with spaces is never shorter than _quoted_word, so MatchFirst picks the same as Or
+                    ((_SUPPRESS_QUOTE + Word(alphanums + " _")("name") + _SUPPRESS_QUOTE) | _quoted_word("_")("name"))
                     + Group(
                         Group(
                             Word(alphanums + "_")
                             + Optional(CaselessKeyword("WITHOUT TIME ZONE") ^ CaselessKeyword("WITH TIME ZONE") ^ CaselessKeyword("PRECISION") ^ CaselessKeyword("VARYING"))
                         )("type_name")
-                        + Optional(_LPAR + Regex(r"[\d\*]+\s*,*\s*\d*")("length") + Optional(_CHAR_SEMANTICS | _BYTE_SEMANTICS)("semantics") + _RPAR)
+                        + Optional(_LPAR + Regex(_RE_COL_LENGTH)("length") + Optional(_CHAR_SEMANTICS | _BYTE_SEMANTICS)("semantics") + _RPAR)
                         + Optional(_TYPE_UNSIGNED)("unsigned")
                         + Optional(_TYPE_ZEROFILL)("zerofill")
                     )("type")
@@ -686,12 +1070,10 @@ class DdlParse(DdlParseBase):
                     + Optional(
                         Regex(r"(?!--)", re.IGNORECASE)
                         + Group(
-                            Optional(Regex(r"\b(?:NOT\s+)?NULL?\b", re.IGNORECASE))("null")
-                            & Optional(Regex(r"\bAUTO_INCREMENT\b", re.IGNORECASE))("auto_increment")
-                            & Optional(Regex(r"\b(UNIQUE|PRIMARY)(?:\s+KEY)?\b", re.IGNORECASE))("key")
-                            & Optional(Regex(
-                                r"\bDEFAULT\b\s+(?:((?:[A-Za-z0-9_\.\'\" -\{\}]|[^\x01-\x7E])*\:\:(?:character varying)?[A-Za-z0-9\[\]]+)|(?:\')((?:\\\'|[^\']|,)+)(?:\')|(?:\")((?:\\\"|[^\"]|,)+)(?:\")|([^,\s]+))",
-                                re.IGNORECASE))("default")
+                            Optional(Regex(_RE_COL_NULL))("null")
+                            & Optional(Regex(_RE_COL_AUTO_INCREMENT))("auto_increment")
+                            & Optional(Regex(_RE_COL_KEY))("key")
+                            & Optional(Regex(_RE_COL_DEFAULT))("default")
                             & Optional(Regex(r"\bCOMMENT\b\s+(\'(\\\'|[^\']|,)+\'|\"(\\\"|[^\"]|,)+\"|[^,\s]+)", re.IGNORECASE))("comment")
                             & Optional(Regex(r"\bENCODE\s+[A-Za-z0-9]+\b", re.IGNORECASE))("encode")  # Redshift
                             & Optional(_COL_ATTR_DISTKEY)("distkey")  # Redshift
@@ -708,10 +1090,38 @@ class DdlParse(DdlParseBase):
     _DDL_PARSE_EXPR = Forward()
     _DDL_PARSE_EXPR << OneOrMore(_COMMENT | _CREATE_TABLE_STATEMENT)
 
+    return _DDL_PARSE_EXPR
+
+
+def _set_primary_key(col):
+    col.not_null = True
+    col.primary_key = True
+
 
-    def __init__(self, ddl=None, source_database=None):
+def _set_unique(col):
+    col.unique = True
+
+
+def _set_not_null(col):
+    col.not_null = True
+
+
+# Table constraint type = column setter
+_TABLE_CONSTRAINT_SETTERS = {
+    "PRIMARY KEY": _set_primary_key,
+    "UNIQUE": _set_unique,
+    "UNIQUE KEY": _set_unique,
+    "NOT NULL": _set_not_null,
+}
+
+
+class DdlParse(DdlParseBase):
+    """DDL parser"""
+
+    def __init__(self, ddl=None, source_database=None, fast=False):
         super().__init__(source_database)
         self._ddl = ddl
+        self._fast = fast
         self._table = DdlParseTable(source_database)
 
     @property
@@ -728,6 +1138,27 @@ class DdlParse(DdlParseBase):
         super(self.__class__, self.__class__).source_database.__set__(self, source_database)
         self._table.source_database = source_database
 
+    @classmethod
+    def enable_packrat(cls, cache_size_limit=128):
+        """
+        Enable pyparsing packrat caching.
+
+        Packrat applies process-wide to every pyparsing grammar.
+
+        :param cache_size_limit: packrat cache size, None is unbounded
+        """
+        ParserElement.enablePackrat(cache_size_limit=cache_size_limit)
+
+    @classmethod
+    def disable_packrat(cls):
+        """Disable pyparsing packrat caching."""
+        if hasattr(ParserElement, "disable_memoization"):
+            ParserElement.disable_memoization()
+        else:
+            # pyparsing 2.x
+            ParserElement._packratEnabled = False
+            ParserElement._parse = ParserElement._parseNoCache
+
     @property
     def ddl(self):
         """DDL script"""
@@ -737,6 +1168,25 @@ class DdlParse(DdlParseBase):
     def ddl(self, ddl):
         self._ddl = ddl
 
+    @classmethod
+    def clear_cache(cls):
+        """Clear the parse result cache."""
+        _parse_cached.cache_clear()
+
+    @property
+    def fast(self):
+        """
+        Fast parse option
+
+        Parse with the hand-written parser,
+        and fall back to the pyparsing grammar for unsupported DDL.
+        """
+        return self._fast
+
+    @fast.setter
+    def fast(self, fast):
+        self._fast = fast
+
     def parse(self, ddl=None, source_database=None):
         """
         Parse DDL script.
@@ -754,36 +1204,142 @@ class DdlParse(DdlParseBase):
         if self._ddl is None:
             raise ValueError("DDL is not specified")
 
-        ret = self._DDL_PARSE_EXPR.parseString(self._ddl)
-        # print(ret.dump())
+        return self._build_table(_parse_cached(self._ddl, self._fast))
+
+    @classmethod
+    def parse_many(cls, ddls, source_database=None, fast=False, workers=None):
+        """
+        Parse DDL scripts in parallel processes.
 
-        if "schema" in ret:
-            self._table.schema = ret["schema"]
+        :param ddls: DDL scripts
+        :param source_database: enum DdlParse.DATABASE
+        :param fast: fast parse option
+        :param workers: max worker processes, None is the number of processors
+        :return: list of DdlParseTable, in the order of ddls.
+        """
 
-        self._table.name = ret["table"]
-        self._table.is_temp = True if "temp" in ret else False
+        ddls = list(ddls)
+        for ddl in ddls:
+            if ddl is None:
+                raise ValueError("DDL is not specified")
 
-        for ret_col in ret["columns"]:
+        # Parse each distinct DDL script only once
+        unique_ddls = list(dict.fromkeys(ddls))
 
-            if ret_col.getName() == "column":
-                # add column
-                col = self._table.columns.append(
-                    column_name=ret_col["name"],
-                    data_type_array=ret_col["type"],
-                    array_brackets=ret_col['array_brackets'] if "array_brackets" in ret_col else None,
-                    constraint=ret_col['constraint'] if "constraint" in ret_col else None)
+        if workers == 1 or len(unique_ddls) <= 1:
+            parsed = [_parse_cached(ddl, fast) for ddl in unique_ddls]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = list(executor.map(_parse_one, unique_ddls, repeat(fast, len(unique_ddls))))
 
-            elif ret_col.getName() == "constraint":
+        parsed = dict(zip(unique_ddls, parsed))
+
+        return [cls(ddl, source_database, fast)._build_table(parsed[ddl]) for ddl in ddls]
+
+    def _build_table(self, parsed):
+        """Build DdlParseTable from the _parse_cached result."""
+
+        schema, name, is_temp, ret_cols = parsed
+
+        if schema is not None:
+            self._table.schema = schema
+
+        self._table.name = name
+        self._table.is_temp = is_temp
+
+        columns = self._table.columns
+        append = columns.append
+
+        for ret_col_name, ret_col in ret_cols:
+
+            if ret_col_name == "column":
+                # add column
+                col_name, data_type, array_brackets, constraint = ret_col
+                append(
+                    column_name=col_name,
+                    data_type_array=dict(data_type),
+                    array_brackets=array_brackets,
+                    constraint=None if constraint is None else dict(constraint))
+
+            elif ret_col_name == "constraint":
                 # set column constraint
-                for col_name in ret_col["constraint_columns"]:
-                    col = self._table.columns[col_name]
+                constraint_type, constraint_columns = ret_col
+                set_constraint = _TABLE_CONSTRAINT_SETTERS.get(constraint_type)
 
-                    if ret_col["type"] == "PRIMARY KEY":
-                        col.not_null = True
-                        col.primary_key = True
-                    elif ret_col["type"] in ["UNIQUE", "UNIQUE KEY"]:
-                        col.unique = True
-                    elif ret_col["type"] == "NOT NULL":
-                        col.not_null = True
+                for col_name in constraint_columns:
+                    col = columns[col_name]
+
+                    if set_constraint is not None:
+                        set_constraint(col)
 
         return self._table
+
+
+def _parse_one(ddl, fast=False):
+    """Parse DDL script in a DdlParse.parse_many worker process."""
+
+    return _parse_cached(ddl, fast)
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(ddl, fast=False):
+    """
+    Parse DDL script, cached by DDL script.
+
+    :param ddl: DDL script
+    :param fast: try _DdlFastParser before the pyparsing grammar
+    :return: (schema, table name, temp flag, ((kind, fields), ...))
+        The result is shared between DdlParse.parse calls, so fields are frozen into tuples.
+        * column : (name, ((type key, value), ...), array brackets, ((constraint name, value), ...) or None)
+        * constraint : (constraint type, (column name, ...))
+    """
+
+    ret = None
+    if fast:
+        ret = _DdlFastParser(ddl).parse()
+
+    if ret is None:
+        ret = _build_grammar().parseString(ddl)
+        # print(ret.dump())
+
+        ret_cols = []
+        for ret_col in ret["columns"]:
+            if ret_col.getName() == "column":
+                data_type = {"type_name": list(ret_col["type"]["type_name"])}
+                for key in ("length", "unsigned", "zerofill"):
+                    if key in ret_col["type"]:
+                        data_type[key] = ret_col["type"][key]
+
+                ret_cols.append(("column", {
+                    "name": ret_col["name"],
+                    "type": data_type,
+                    "array_brackets": ret_col["array_brackets"] if "array_brackets" in ret_col else None,
+                    "constraint": dict(ret_col["constraint"].items()) if "constraint" in ret_col else None,
+                }))
+
+            elif ret_col.getName() == "constraint":
+                ret_cols.append(("constraint", {
+                    "type": ret_col["type"],
+                    "constraint_columns": tuple(ret_col["constraint_columns"]),
+                }))
+
+        ret = (ret["schema"] if "schema" in ret else None, ret["table"], "temp" in ret, ret_cols)
+
+    schema, name, is_temp, ret_cols = ret
+
+    return schema, name, is_temp, tuple(_freeze_parsed_item(kind, fields) for kind, fields in ret_cols)
+
+
+def _freeze_parsed_item(kind, fields):
+    """Freeze parsed column or table constraint fields into tuples."""
+
+    if kind == "column":
+        data_type = tuple(
+            (key, tuple(val) if key == "type_name" else val) for key, val in fields["type"].items())
+        constraint = fields["constraint"]
+
+        return kind, (
+            fields["name"], data_type, fields["array_brackets"],
+            None if constraint is None else tuple(constraint.items()))
+
+    return kind, (fields["type"], tuple(fields["constraint_columns"]))
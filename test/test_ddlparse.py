@@ -3,7 +3,10 @@
 import pytest, re, textwrap
 from enum import IntEnum
 
-from ddlparse.ddlparse import DdlParse, DdlParseColumn
+from pyparsing import ParseException
+
+import ddlparse.ddlparse as ddlparse_module
+from ddlparse.ddlparse import DdlParse, DdlParseColumn, _DdlFastParser
 
 
 TEST_DATA = {
@@ -1365,3 +1368,224 @@ def test_constraint_compatibility():
     assert dl_col.primary_key is True
     assert dl_col.unique is False
     assert dl_col.comment == 'foo'
+
+
+def test_packrat():
+    ddl = TEST_DATA["basic"]["ddl"]
+
+    expected = DdlParse().parse(ddl).to_bigquery_fields()
+
+    # Parse with packrat caching, not from the parse result cache
+    DdlParse.enable_packrat()
+    try:
+        DdlParse.clear_cache()
+        assert DdlParse().parse(ddl).to_bigquery_fields() == expected
+    finally:
+        DdlParse.disable_packrat()
+
+    DdlParse.clear_cache()
+    assert DdlParse().parse(ddl).to_bigquery_fields() == expected
+
+
+@pytest.mark.parametrize(("test_case"), TEST_DATA.keys())
+def test_parse_fast(test_case):
+    data = TEST_DATA[test_case]
+
+    table = DdlParse(source_database=data["database"]).parse(data["ddl"])
+    table_fast = DdlParse(source_database=data["database"], fast=True).parse(data["ddl"])
+
+    assert table_fast.schema == table.schema
+    assert table_fast.name == table.name
+    assert table_fast.is_temp == table.is_temp
+    assert list(table_fast.columns.keys()) == list(table.columns.keys())
+
+    for col_fast, col in zip(table_fast.columns.values(), table.columns.values()):
+        for attr in ["name", "data_type", "is_unsigned", "is_zerofill", "length", "scale", "array_dimensional",
+                     "not_null", "primary_key", "unique", "constraint", "comment", "auto_increment",
+                     "distkey", "sortkey", "encode", "default", "character_set"]:
+            assert getattr(col_fast, attr) == getattr(col, attr)
+
+    assert table_fast.to_bigquery_fields() == table.to_bigquery_fields()
+
+
+def test_parse_fast_fallback():
+    # Supported by the hand-written parser
+    assert _DdlFastParser(TEST_DATA["basic"]["ddl"]).parse() is not None
+
+    # Fall back to pyparsing grammar
+    assert _DdlFastParser(TEST_DATA["constraint_mysql"]["ddl"]).parse() is None
+
+    # Error : DDL is not CREATE TABLE statement
+    with pytest.raises(ParseException):
+        DdlParse(fast=True).parse("SELECT 1;")
+
+
+def test_parse_cache():
+    ddl = TEST_DATA["basic"]["ddl"]
+
+    DdlParse.clear_cache()
+    table_1 = DdlParse().parse(ddl)
+    table_2 = DdlParse().parse(ddl)
+
+    # Cached parse result rebuilds another table
+    assert table_1 is not table_2
+    assert table_1.to_bigquery_fields() == table_2.to_bigquery_fields()
+
+    table_1.columns["Col_01"].not_null = False
+    assert table_2.columns["Col_01"].not_null is True
+    assert DdlParse().parse(ddl).columns["Col_01"].not_null is True
+
+    # Cached parse result holds no mutable containers
+    def assert_frozen(value):
+        assert isinstance(value, (tuple, str, bool, type(None)))
+        if isinstance(value, tuple):
+            for item in value:
+                assert_frozen(item)
+
+    for fast in [False, True]:
+        assert_frozen(ddlparse_module._parse_cached(ddl, fast))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many(workers):
+    ddls = [TEST_DATA["basic"]["ddl"], TEST_DATA["constraint_mysql"]["ddl"], TEST_DATA["basic"]["ddl"]]
+
+    tables = DdlParse.parse_many(ddls, source_database=DdlParse.DATABASE.mysql, workers=workers)
+
+    assert len(tables) == 3
+    for ddl, table in zip(ddls, tables):
+        expected = DdlParse(ddl, DdlParse.DATABASE.mysql).parse()
+        assert table.source_database == DdlParse.DATABASE.mysql
+        assert table.name == expected.name
+        assert table.to_bigquery_fields() == expected.to_bigquery_fields()
+
+    # Duplicate DDL builds another table
+    assert tables[0] is not tables[2]
+
+    with pytest.raises(ValueError):
+        DdlParse.parse_many([None], workers=workers)
+
+
+def test_bq_data_type_cache():
+    col = DdlParseColumn(
+        name='Col',
+        data_type_array={'type_name': ['NUMERIC']},
+    )
+
+    assert col.bigquery_data_type == "INTEGER"
+    assert col.bigquery_mode == "NULLABLE"
+
+    # Cache is cleared by setters
+    col.source_database = DdlParse.DATABASE.oracle
+    assert col.bigquery_data_type == "BIGNUMERIC"
+
+    col.not_null = True
+    assert col.bigquery_mode == "REQUIRED"
+
+    col.constraint = "UNIQUE"
+    assert col.bigquery_mode == "NULLABLE"
+
+    # Subclass setter does not recurse
+    class SubColumn(DdlParseColumn):
+        pass
+
+    sub_col = SubColumn(
+        name='Col',
+        data_type_array={'type_name': ['NUMERIC']},
+    )
+    assert sub_col.bigquery_data_type == "INTEGER"
+
+    sub_col.source_database = DdlParse.DATABASE.oracle
+    assert sub_col.source_database == DdlParse.DATABASE.oracle
+    assert sub_col.bigquery_data_type == "BIGNUMERIC"
+
+
+def test_bq_data_type_direct(monkeypatch):
+    bq_direct = ddlparse_module._BQ_DIRECT.items()
+
+    # Compare with the _BQ_DATA_TYPE_DIC scan
+    monkeypatch.setattr(ddlparse_module, "_BQ_DIRECT", {})
+
+    for source_database in [None] + list(DdlParse.DATABASE):
+        for data_type, bq_type in bq_direct:
+            col = DdlParseColumn(
+                name='Col',
+                data_type_array={'type_name': [data_type]},
+                source_database=source_database,
+            )
+            assert col.bigquery_data_type == bq_type
+
+
+@pytest.mark.parametrize(("data_type", "bq_type"), [
+    ("NCHAR", "STRING"),
+    ("ROWID", "STRING"),
+    ("INT_CHAR", "STRING"),
+    ("UNSIGNED INT", "INTEGER"),
+    ("BINARY_DOUBLE", "FLOAT"),
+    ("TIMESTAMP WITH LOCAL TIME ZONE", "TIMESTAMP"),
+    ("LONG RAW", "BYTES"),
+])
+def test_bq_data_type_combined(data_type, bq_type):
+    col = DdlParseColumn(
+        name='Col',
+        data_type_array={'type_name': [data_type]},
+    )
+
+    assert col.bigquery_data_type == bq_type
+
+
+def test_columns_case_insensitive():
+    ddl = """
+        CREATE TABLE Sample_Table (
+          Col_01 integer,
+          Col_02 integer
+        );
+        """
+
+    columns = DdlParse().parse(ddl).columns
+
+    assert list(columns.keys()) == ["col_01", "col_02"]
+    assert "Col_01" in columns
+    assert "COL_02" in columns
+    assert "Col_03" not in columns
+    assert columns["COL_01"] is columns["col_01"]
+
+
+def test_constraint_cache():
+    col = DdlParseColumn(
+        name='Col',
+        data_type_array={'type_name': ['INT']},
+        constraint={'null': 'NOT NULL'},
+    )
+
+    assert col.constraint == "NOT NULL"
+
+    # Cache is cleared by setters
+    col.primary_key = True
+    assert col.constraint == "PRIMARY KEY"
+
+    col.unique = True
+    assert col.constraint == "PRIMARY KEY UNIQUE"
+
+    col.not_null = False
+    assert col.constraint == "UNIQUE"
+
+    col.constraint = "NOT NULL"
+    assert col.constraint == "NOT NULL"
+
+
+@pytest.mark.parametrize("length, expected", [
+    ("10", (10, None)),
+    ("10, 2", (10, 2)),
+    ("10,,2", (10, 2)),
+    ("10 , 0", (10, None)),
+    ("*", ("*", None)),
+    ("*,4", ("*", 4)),
+])
+def test_column_length(length, expected):
+    col = DdlParseColumn(
+        name='Col',
+        data_type_array={'type_name': ['NUMBER'], 'length': length},
+    )
+
+    assert (col.length, col.scale) == expected